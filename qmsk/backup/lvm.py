@@ -45,19 +45,23 @@ class LVM (object) :
         self.name = name
         self.sudo = sudo
 
+        # precomputed lv_name/lv_path prefixes
+        self._lv_prefix = name + '/'
+        self._dev_prefix = '/dev/' + name + '/'
+
     def lv_name (self, lv) :
         """
             vg/lv name.
         """
 
-        return '{vg}/{lv}'.format(vg=self.name, lv=lv)
+        return self._lv_prefix + lv
 
     def lv_path (self, lv) :
         """
             /dev/vg/lv path.
         """
 
-        return '/dev/{vg}/{lv}'.format(vg=self.name, lv=lv)
+        return self._dev_prefix + lv
 
     def lv_dev (self, lv):
         """
@@ -79,9 +83,7 @@ class LVM (object) :
             Invoke a command with options/arguments, given via Python arguments/keyword arguments
         """
 
-        log.debug("{cmd} {opts} {args}".format(cmd=cmd, args=args, opts=opts))
-
-        # invoke
+        # invoke logs the full argv
         invoke(self.LVM, [cmd] + optargs(*args, **opts), sudo=self.sudo)
 
     def volume (self, name) :
@@ -105,11 +107,11 @@ class LVM (object) :
                 **opts      - LVMSnapshot.create() options (e.g. size)
         """
 
-        log.debug("creating snapshot from {base}: wait={wait}, retry={retry} {opts}".format(base=base, wait=wait, retry=retry, opts=opts))
+        log.debug("creating snapshot from %s: wait=%s, retry=%s %s", base, wait, retry, opts)
         snapshot = LVMSnapshot.create(self, base, **opts)
 
         try :
-            log.debug("got: {0}".format(snapshot))
+            log.debug("got: %s", snapshot)
             yield snapshot
 
         finally:
@@ -172,13 +174,9 @@ class LVMVolume (object) :
         self.lvm = lvm
         self.name = name
 
-    @property
-    def lvm_path (self) :
-        return self.lvm.lv_name(self.name)
-
-    @property
-    def dev_path (self) :
-        return self.lvm.lv_path(self.name)
+        # vg/name are immutable, so the paths can be computed once
+        self.lvm_path = lvm.lv_name(name)
+        self.dev_path = lvm.lv_path(name)
 
     @property
     def dev(self):
@@ -191,15 +189,11 @@ class LVMVolume (object) :
             Raises an LVMError otherwise.
         """
 
-        # lvdisplay
+        # the /dev/<vg>/<lv> node answers this directly, without forking lvs for a full VG scan
         try :
-            self.lvm.command('lvs', self.lvm_path)
-
-        except InvokeError :
-            raise LVMError("Unable to lvdisplay LV: {path}".format(path=self.lvm_path))
+            os.lstat(self.dev_path)
 
-        # dev
-        if not self.test_dev() :
+        except FileNotFoundError :
             raise LVMError("LV dev does not exist: {path}".format(path=self.dev_path))
 
     def verify_missing (self) :
@@ -8,6 +8,7 @@ import contextlib
 import logging
 import os
 import os.path
+import re
 import stat
 import tempfile
 
@@ -87,12 +88,9 @@ class Mount (object) :
             Test if the given mountpoint is mounted.
         """
 
-        # workaround http://bugs.python.org/issue2466
-        if os.path.exists(self.mnt) and not os.path.exists(os.path.join(self.mnt, '.')) :
-            # this is a sign of a mountpoint that we do not have access to
-            return True
-
-        return os.path.ismount(self.mnt)
+        # the kernel's own list, unlike os.path.ismount() which mis-reports mountpoints that we
+        # cannot stat into (http://bugs.python.org/issue2466)
+        return os.path.realpath(self.mnt) in mountpoints()
 
     def close (self) :
         """
@@ -165,6 +163,26 @@ def mount (dev, mnt=None, name_hint='tmp', **kwargs) :
             os.rmdir(tmpdir)
 
 
+# the kernel octal-escapes space/tab/newline/backslash in mountinfo fields
+MOUNTINFO_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+def mountinfo_unescape (path):
+    """
+        Decode the \\ooo octal escapes in a /proc/self/mountinfo path field.
+    """
+
+    if '\\' in path:
+        return MOUNTINFO_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), path)
+    else:
+        return path
+
+def mountpoints():
+    """
+        Set of mounted filesystem paths.
+    """
+
+    return frozenset(mountinfo_unescape(line.split()[4]) for line in open('/proc/self/mountinfo'))
+
 def mounts():
     """
         Yield mounted filesystems
@@ -187,8 +205,9 @@ def find (path):
     """
 
     name = ''
+    mounted = mountpoints()
 
-    while not os.path.ismount(path) and path != '/':
+    while path not in mounted and path != '/':
         path, basename = os.path.split(path)
 
         name = os.path.join(basename, name)
@@ -11,6 +11,7 @@ import os.path
 import qmsk.backup.mount
 import qmsk.invoke
 import re
+import time
 
 from qmsk.backup.lvm import LVM, LVMVolume, LVMSnapshot
 from qmsk.backup import zfs
@@ -300,8 +301,11 @@ class LVMSource(Source):
         # snapshot
         log.info("Creating LVM snapshot: %s", self.lvm_volume)
 
+        # unique tag, so a stale snapshot left behind by a crashed backup does not block the next run
+        tag = 'backup-{timestamp:x}'.format(timestamp=int(time.time()))
+
         with self.lvm.snapshot(self.lvm_volume,
-                tag     = 'backup',
+                tag     = tag,
                 **self.lvm_opts
         ) as snapshot:
             # mount
@@ -1,6 +1,6 @@
 import contextlib
-import datetime
 import logging
+import time
 
 import qmsk.invoke
 
@@ -28,7 +28,10 @@ class CommandError (Error):
 
     pass
 
-def zfs(*args, invoker=qmsk.invoke.Invoker(), **opts):
+# shared by every caller that does not pass an explicit invoker
+_DEFAULT_INVOKER = qmsk.invoke.Invoker()
+
+def zfs(*args, invoker=_DEFAULT_INVOKER, **opts):
     try:
         stdout = invoker.invoke(ZFS, qmsk.invoke.optargs(*args), **opts)
     except qmsk.invoke.InvokeError as error:
@@ -42,10 +45,11 @@ def zfs(*args, invoker=qmsk.invoke.Invoker(), **opts):
     if stdout is None:
         return None
     else:
-        return [line.strip().split('\t') for line in stdout]
+        # -H output is exact \t-separated fields, so only the line terminator needs stripping
+        return [line.rstrip('\n').split('\t') for line in stdout]
 
 @contextlib.contextmanager
-def zfs_stream(*args, invoker=qmsk.invoke.Invoker(), **opts):
+def zfs_stream(*args, invoker=_DEFAULT_INVOKER, **opts):
     try:
         with invoker.stream(ZFS, qmsk.invoke.optargs(*args), **opts) as stream:
             yield stream
@@ -66,7 +70,12 @@ def snapshot(zfs, snapshot_name=None, prefix=SNAPSHOT_PREFIX, **opts):
     """
 
     if snapshot_name is None:
-        snapshot_name = '{prefix}_{timestamp}'.format(prefix=prefix, timestamp=datetime.datetime.now().isoformat())
+        # same shape as datetime.now().isoformat(), without the heavier datetime machinery
+        now = time.time()
+        snapshot_name = '{prefix}_{timestamp}.{us:06d}'.format(prefix=prefix,
+                timestamp   = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)),
+                us          = int(now % 1.0 * 1000000),
+        )
 
     snapshot = zfs.snapshot(snapshot_name, **opts)
 
@@ -81,23 +90,32 @@ def open(name, **opts):
     """
 
     zfs = Filesystem(name, **opts)
-    zfs.check()
+    zfs.prime('mountpoint')
 
     return zfs
 
 class Filesystem (object):
     @classmethod
-    def list(cls):
-        for name, in zfs('list', '-H', '-tfilesystem', '-oname'):
+    def list(cls, depth=None):
+        """
+            List filesystems.
+
+            depth:int   - limit recursion depth, e.g. depth=1 for pools and their direct children.
+        """
+
+        for name, in zfs('list', '-H', '-tfilesystem', '-oname',
+                '-d{depth}'.format(depth=depth) if depth is not None else None,
+        ):
             yield cls(name)
 
     def __init__(self, name, noop=None, invoker=None):
         self.name = str(name)
         self.noop = noop
-        self.invoker = invoker
+        self.invoker = invoker if invoker is not None else _DEFAULT_INVOKER
 
         # cache
         self._snapshots = None
+        self._properties = None
 
     def __str__(self):
         return self.name
@@ -146,7 +164,24 @@ class Filesystem (object):
             Raises ZFSError if unable to list the zfs filesystem.
         """
 
-        self.zfs_read('list', '-tfilesystem', self.name)
+        # -d0 to avoid walking any child datasets
+        self.zfs_read('list', '-d0', '-tfilesystem', self.name)
+
+    def prime(self, *properties):
+        """
+            Fetch and cache the given properties with a single zfs get.
+
+            Amortizes the per-property round-trip of get() when running over a remote invoker;
+            also raises ZFSError if the zfs filesystem does not exist, like check().
+        """
+
+        self._properties = {}
+
+        for fs, property_name, value, source in self.zfs_read('get', '-H', ','.join(properties), self.name):
+            if value == '-' and source == '-':
+                self._properties[property_name] = None
+            else:
+                self._properties[property_name] = value
 
     def get(self, property_name):
         """
@@ -155,6 +190,9 @@ class Filesystem (object):
             Returns None if the property does not exist or is not set.
         """
 
+        if self._properties is not None and property_name in self._properties:
+            return self._properties[property_name]
+
         for fs, property_name, value, source in self.zfs_read('get', '-H', property_name, self.name):
             if value == '-' and source == '-':
                 return None
@@ -164,6 +202,9 @@ class Filesystem (object):
     def set(self, property, value):
         self.zfs_write('set', '{property}={value}'.format(property=property, value=value), self.name)
 
+        if self._properties is not None and not self.noop:
+            self._properties[property] = value
+
     @property
     def mountpoint(self):
         mountpoint = self.get('mountpoint')
@@ -187,10 +228,19 @@ class Filesystem (object):
             **opts
         )
 
-    def list_snapshots(self, *properties):
+    def list_snapshots(self, *properties, depth=None):
+        """
+            List snapshots of this filesystem.
+
+            depth:int   - limit recursion depth, e.g. depth=1 for only this dataset's own snapshots.
+        """
+
         o = ','.join(('name', 'userrefs') + properties)
 
-        for name, userrefs, *propvalues in self.zfs_read('list', '-H', '-tsnapshot', '-o' + o, self.name):
+        for name, userrefs, *propvalues in self.zfs_read('list', '-H', '-tsnapshot', '-o' + o,
+                '-d{depth}'.format(depth=depth) if depth is not None else None,
+                self.name,
+        ):
             snapshot = self._parse_snapshot(name,
                     userrefs    = int(userrefs),
                     properties  = {name: (None if value == '-' else value) for name, value in zip(properties, propvalues)},
@@ -207,15 +257,13 @@ class Filesystem (object):
             Raises ZFSError if there are no snapshots.
         """
 
-        snapshot = None
-
-        for snapshot in self.list_snapshots():
-            continue
+        # -S creation sorts newest-first, so only the first row matters
+        for name, userrefs in self.zfs_read('list', '-H', '-tsnapshot', '-oname,userrefs', '-Screation', '-d1', self.name):
+            return self._parse_snapshot(name,
+                    userrefs    = int(userrefs),
+            )
 
-        if snapshot:
-            return snapshot
-        else:
-            raise ZFSError("No snapshots")
+        raise ZFSError("No snapshots")
 
     @property
     def snapshots(self):
@@ -351,10 +399,13 @@ class Snapshot (object):
     def set(self, property, value):
         self.filesystem.zfs_write('set', '{property}={value}'.format(property=property, value=value), str(self))
 
-    # XXX: invalidate ZFS._snapshots cache
     def destroy (self):
         self.filesystem.zfs_write('destroy', self)
 
+        # invalidate Filesystem._snapshots cache
+        if self.filesystem._snapshots:
+            self.filesystem._snapshots.pop(self.name, None)
+
     def bookmark(self, bookmark):
         self.filesystem.zfs_write('bookmark', self, str(self.filesystem) + '#' + bookmark)
 
@@ -368,7 +419,7 @@ class Snapshot (object):
     def release(self, tag):
         self.filesystem.zfs_write('release', tag, self)
 
-    def _send_options(self, incremental=None, full_incremental=None, properties=False, replication_stream=None, raw=None, compressed=None, large_block=None, dedup=None):
+    def _send_options(self, incremental=None, full_incremental=None, properties=False, replication_stream=None, raw=None, compressed=None, large_block=None, embed=None, holds=None, dedup=None):
         """
             incremental: Snapshot, None     - send incremental from given snapshot
             properties: bool                - send ZFS properties
@@ -378,6 +429,8 @@ class Snapshot (object):
             '--raw' if raw else None, # passed as first argument to allow whitelisting `sudo /usr/sbin/zfs send --raw *`
             '-c' if compressed else None,
             '-L' if large_block else None,
+            '-e' if embed else None,
+            '-h' if holds else None,
             '-D' if dedup else None,
             '-R' if replication_stream else None,
             '-p' if properties else None,
@@ -440,7 +493,7 @@ class Source:
     def __str__(self):
         return self.source
 
-    def stream_send(self, raw=None, compressed=None, large_block=None, dedup=None, incremental=None, full_incremental=None, properties=False, replication_stream=None, snapshot=None, bookmark=None, purge_bookmark=None, purge_bookmarks=None, keep_bookmark=None):
+    def stream_send(self, raw=None, compressed=None, large_block=None, embed=None, holds=None, dedup=None, incremental=None, full_incremental=None, properties=False, replication_stream=None, snapshot=None, bookmark=None, purge_bookmark=None, purge_bookmarks=None, keep_bookmark=None):
         """
             Returns a context manager for the send stream.
         """
@@ -454,6 +507,8 @@ class Source:
             '-w' if raw else None,
             '-c' if compressed else None,
             '-L' if large_block else None,
+            '-e' if embed else None,
+            '-h' if holds else None,
             '-D' if dedup else None,
             '-R' if replication_stream else None,
             '-p' if properties else None,
@@ -4,16 +4,38 @@
 
 import collections.abc
 import contextlib
+import fcntl
+import functools
 import io
 import logging
 import os
 import subprocess
+import threading
 
 log = logging.getLogger('qmsk.invoke')
 
 SUDO = '/usr/bin/sudo'
 ENCODING = 'utf-8'
 
+# grow kernel pipe buffers from the 64KiB linux default, enough to absorb bursty producers/consumers
+PIPE_SIZE = 1 << 20
+
+# linux-only, and only in the fcntl module since python 3.10
+F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', None)
+
+def _grow_pipe (file):
+    """
+        Best-effort grow of the kernel pipe buffer backing the given pipe file.
+    """
+
+    if F_SETPIPE_SZ is None:
+        return
+
+    try:
+        fcntl.fcntl(file.fileno(), F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        pass # capped by /proc/sys/fs/pipe-max-size
+
 class InvokeError (Exception):
     def __init__ (self, cmd, exit, stderr):
         self.cmd = cmd
@@ -64,7 +86,7 @@ def invoke (cmd, args, stdin=None, stdout=None, quiet=False, setenv=None, sudo=F
         Returns stdout str.
     """
 
-    log.debug("{sudo}{cmd} {args}".format(sudo=('sudo ' if sudo else ''), cmd=cmd, args=' '.join(args)))
+    log.debug("%s%s %s", 'sudo ' if sudo else '', cmd, args)
 
     if stdin is True:
         # keep process stdin/out
@@ -114,7 +136,15 @@ def invoke (cmd, args, stdin=None, stdout=None, quiet=False, setenv=None, sudo=F
     if input and encoding:
         input = input.encode(encoding)
 
-    p = subprocess.Popen(argv, stdin=popen_stdin, stdout=popen_stdout, stderr=subprocess.PIPE, env=env)
+    # close_fds=False allows subprocess to use os.posix_spawn() instead of fork+exec, avoiding the
+    # copy of the parent page tables; python fds are close-on-exec per PEP 446, so nothing leaks
+    p = subprocess.Popen(argv, stdin=popen_stdin, stdout=popen_stdout, stderr=subprocess.PIPE, env=env, close_fds=False)
+
+    if input and p.stdin:
+        _grow_pipe(p.stdin)
+
+    if p.stdout:
+        _grow_pipe(p.stdout)
 
     # get output
     # returns None if not io
@@ -136,6 +166,16 @@ def invoke (cmd, args, stdin=None, stdout=None, quiet=False, setenv=None, sudo=F
     else:
         return io.BytesIO(stdout)
 
+@functools.lru_cache(maxsize=None)
+def _opt_flag (name):
+    """
+        Mangle a keyword-argument name into its --option flag.
+
+        Cached; the option-name space is the small fixed set used by the wrapped commands.
+    """
+
+    return '--' + name.replace('_', '-')
+
 def process_opt (name, value):
     """
         Mangle from python keyword-argument dict format to command-line option tuple format.
@@ -167,7 +207,7 @@ def process_opt (name, value):
     """
 
     # mangle opt
-    opt = '--' + name.replace('_', '-')
+    opt = _opt_flag(name)
 
     if value is True:
         # flag opt
@@ -204,17 +244,19 @@ def optargs (*args, **kwargs):
         ['--foo', 'bar']
     """
 
-    ## opts
-    # process
-    opts = [process_opt(opt, value) for opt, value in kwargs.items()]
+    argv = []
 
-    # flatten
-    opts = [str(part) for parts in opts for part in parts]
+    ## opts
+    for opt, value in kwargs.items():
+        # process_opt parts are always str
+        argv.extend(process_opt(opt, value))
 
     ## args
-    args = [str(arg) for arg in args if arg]
+    for arg in args:
+        if arg:
+            argv.append(arg if isinstance(arg, str) else str(arg))
 
-    return opts + args
+    return argv
 
 def command (cmd, *args, **opts):
     """
@@ -223,12 +265,27 @@ def command (cmd, *args, **opts):
         Return stdout. See invoke()
     """
 
-    log.debug("{cmd} {opts} {args}".format(cmd=cmd, args=args, opts=opts))
+    log.debug("%s %s %s", cmd, opts, args)
 
     # invoke
     return invoke(cmd, optargs(*args, **opts))
 
 
+def _drain (file, buffer):
+    """
+        Read file into buffer until EOF.
+
+        Used to drain stderr concurrently while streaming stdout, so the child never blocks on a full stderr pipe.
+    """
+
+    while True:
+        chunk = file.read(io.DEFAULT_BUFFER_SIZE)
+
+        if not chunk:
+            break
+
+        buffer.extend(chunk)
+
 @contextlib.contextmanager
 def stream (cmd, args, sudo=None, stdin=None, encoding=ENCODING):
     """
@@ -238,20 +295,26 @@ def stream (cmd, args, sudo=None, stdin=None, encoding=ENCODING):
 
             >>> with stream('test') as stdout:
             >>>     print(stdout.read())
-
-        XXX: deadlock on stderr?
     """
 
-    log.debug("{sudo}{cmd} {args}".format(sudo=('sudo ' if sudo else ''), cmd=cmd, args=' '.join(args)))
+    log.debug("%s%s %s", 'sudo ' if sudo else '', cmd, args)
 
     argv = [cmd] + args
 
     if sudo:
         argv = [SUDO] + argv
 
-    p = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    # close_fds=False to use os.posix_spawn(), see invoke()
+    p = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False)
     error = None
 
+    _grow_pipe(p.stdout)
+
+    # drain stderr concurrently with the caller consuming stdout, e.g. `zfs send -v` progress output
+    stderr_buffer = bytearray()
+    stderr_thread = threading.Thread(target=_drain, args=(p.stderr, stderr_buffer))
+    stderr_thread.start()
+
     try:
         yield p.stdout
 
@@ -264,9 +327,10 @@ def stream (cmd, args, sudo=None, stdin=None, encoding=ENCODING):
 
     finally:
         status = p.wait()
+        stderr_thread.join()
 
     # collect any output
-    stderr = p.stderr.read()
+    stderr = bytes(stderr_buffer)
 
     if stderr:
         stderr = stderr.decode(encoding or 'ascii', errors='replace')